@@ -16,13 +16,13 @@ so the the operation can be reversed.
 ############
 # Standard #
 ############
-import copy
 import logging
-from math import pi, cos, tan, sin, fabs
+from math import pi, cos, sin, fabs
 
 ###############
 # Third Party #
 ###############
+import numpy as np
 from ophyd import SoftPositioner
 
 ##########
@@ -32,6 +32,7 @@ from .points import StandPoint, Point
 
 logger = logging.getLogger(__name__)
 
+
 class AngledJoint:
     """
     A class representing two angled joint motors as a single axis.
@@ -53,15 +54,30 @@ class AngledJoint:
     Attributes
     ----------
     alpha : float
-        The angle of the tilted motor in radians
+        The angle of the tilted motor in radians. May be set on an instance,
+        or on a class to change its default
     """
     alpha = pi/12.
+    _trig_alpha = None
+    _matrix = None
 
     def __init__(self, lift=None, slide=None, offset=None):
 
         self.slide  = slide
         self.lift   = lift
+        self.offset = offset
+
+
+    @property
+    def offset(self):
+        """
+        The (x,y,z) position of the joint when all motors are at nominal zero
+        """
+        return self._offset
+
 
+    @offset.setter
+    def offset(self, offset):
         if not isinstance(offset, Point):
             try:
                 offset = Point(*offset)
@@ -70,7 +86,22 @@ class AngledJoint:
                                "".format(type(offset)))
                 offset = Point(0,0,0)
 
-        self.offset = offset
+        #Keep scalar copies for the hot paths
+        self._offset = offset
+        self._ox, self._oy, self._oz = offset
+
+
+    def _trig(self):
+        """
+        Sine and cosine of :attr:`.alpha`, only recomputed after the angle
+        changes, whether on the instance or on the class
+        """
+        alpha = self.alpha
+        if alpha != self._trig_alpha:
+            self._sin_a, self._cos_a = sin(alpha), cos(alpha)
+            self._trig_alpha = alpha
+            self._matrix = None
+        return self._sin_a, self._cos_a
 
 
     @property
@@ -78,8 +109,21 @@ class AngledJoint:
         """
         Displacement of the joint motors from the nominal zero
         """
-        if not self.slide:
-            return self.lift.position
+        slide, lift = self._readback()
+
+        if self.slide is None:
+            return lift
+        else:
+            return (slide, lift)
+
+
+    def _readback(self):
+        """
+        Current (slide, lift) motor positions, using zero for a missing slide
+        """
+        if self.slide is None:
+            return (0., self.lift.position)
+
         else:
             return (self.slide.position, self.lift.position)
 
@@ -89,9 +133,12 @@ class AngledJoint:
         """
         Position of the ball joint in rest coordinates as a :class:`.Point`
         """
-        return Point(self.joint.x+self.offset.x,
-                     self.joint.y+self.offset.y,
-                     self.joint.z+self.offset.z)
+        slide, lift  = self._readback()
+        sin_a, cos_a = self._trig()
+
+        return Point(slide         + self._ox,
+                     lift*sin_a    + self._oy,
+                     lift*cos_a    + self._oz)
 
 
     @property
@@ -99,13 +146,53 @@ class AngledJoint:
         """
         Displacement of the ball joint from nominal zero as :class:`.Point`
         """
-        if not self.slide:
-            slide, lift = 0., self.displacement
+        return Point._make(self._joint_tuple())
+
+
+    def _joint_tuple(self):
+        """
+        Displacement of the ball joint from nominal zero as a plain tuple
+        """
+        slide, lift  = self._readback()
+        sin_a, cos_a = self._trig()
+
+        return (slide, lift*sin_a, lift*cos_a)
 
-        else:
-            slide, lift = self.displacement
 
-        return Point(slide, lift*sin(self.alpha), lift*cos(self.alpha))
+    def _linear_map(self):
+        """
+        Matrix of shape (3, 2) mapping (slide, lift) to the joint displacement
+        """
+        sin_a, cos_a = self._trig()
+        if self._matrix is None:
+            self._matrix = np.array([[1., 0.],
+                                     [0., sin_a],
+                                     [0., cos_a]])
+        return self._matrix
+
+
+    def position_batch(self, displacements):
+        """
+        Vectorized version of :attr:`.position` for many motor displacements
+
+        Parameters
+        ----------
+        displacements : array_like
+            Array of shape (N,) of lift positions if there is no slide,
+            otherwise an array of shape (N, 2) of (slide, lift) positions
+
+        Returns
+        -------
+        positions : ``numpy.ndarray``
+            Array of shape (N, 3) of joint positions in rest coordinates
+        """
+        displacements = np.asarray(displacements, dtype=float)
+
+        if self.slide is None:
+            displacements = np.stack([np.zeros_like(displacements),
+                                      displacements], axis=1)
+
+        return displacements @ self._linear_map().T + np.asarray(self.offset)
 
 
     def invert(self, point, offset=True):
@@ -132,21 +219,61 @@ class AngledJoint:
         ValueError :
             If the given position is not possible for the joint
         """
-        #Convert to Point object
-        if not isinstance(point, Point):
-            point = Point(*point, 0)
+        #Unpack the target coordinates, works for any Point or tuple
+        return self._invert_xy(point[0], point[1], offset=offset)
 
+
+    def _invert_xy(self, x, y, offset=True):
+        """
+        Scalar implementation of :meth:`.invert` taking the target x and y
+        as plain floats
+        """
         #Find displacement
         if offset:
-            point = Point(point.x - self.offset.x,
-                          point.y - self.offset.y,
-                          0.)
+            x, y = x - self._ox, y - self._oy
+
+        sin_a, _ = self._trig()
 
-        if not self.slide:
-            return point.y/sin(self.alpha)
+        if self.slide is None:
+            return y/sin_a
 
         else:
-            return (point.x, point.y/sin(self.alpha))
+            return (x, y/sin_a)
+
+
+    def invert_batch(self, points, offset=True):
+        """
+        Vectorized version of :meth:`.invert` for many target points at once
+
+        Parameters
+        ----------
+        points : array_like
+            Array of shape (N, 2) of desired x,y coordinates of the joint
+
+        offset : bool, optional
+            Subtract the offset before calculating the motor positions. If set
+            to False, just the displacement of the motors should be entered
+
+        Returns
+        -------
+        positions : ``numpy.ndarray``
+            Array of shape (N,) of lift positions if there is no slide,
+            otherwise an array of shape (N, 2) of (slide, lift) positions
+        """
+        points = np.asarray(points, dtype=float)
+        x, y   = points[:,0], points[:,1]
+
+        #Find displacement
+        if offset:
+            x, y = x - self._ox, y - self._oy
+
+        sin_a, _ = self._trig()
+
+        if self.slide is None:
+            return y/sin_a
+
+        else:
+            return np.stack([x, y/sin_a], axis=1)
 
 
     def set_displacement(self, displacement, relative=False):
@@ -168,12 +295,12 @@ class AngledJoint:
             Status of the requested move, or list of both requested moves
         """
 
-        if not self.slide:
+        if self.slide is None:
             if relative:
                 displacement += self.lift.position
 
-            logger.info("Setting motors to {} from nominal "
-                        " zero".format(displacement))
+            logger.info("Setting motors to %s from nominal zero",
+                        displacement)
 
             return self.lift.move(displacement, wait=False)
 
@@ -181,8 +308,8 @@ class AngledJoint:
             if relative:
                 displacement = (displacement[0]+self.slide.position,
                                 displacement[1]+self.lift.position)
-            logger.info("Setting motors to {} from nominal "
-                        " zero".format(displacement))
+            logger.info("Setting motors to %s from nominal zero",
+                        displacement)
             return [self.slide.move(displacement[0], wait=False),
                     self.lift.move(displacement[1],  wait=False)],
 
@@ -220,7 +347,7 @@ class AngledJoint:
         Stop all motion
         """
         logger.info("Stopping joint")
-        if self.slide:
+        if self.slide is not None:
             self.slide.stop()
         self.lift.stop()
 
@@ -241,20 +368,21 @@ class AngledJoint:
         joint : :class:`.Joint`
             Copied joint with ``SoftPositioner`` slide and lift
         """
-        #Copy stand
-        joint = copy.copy(joint)
-
         #Method to duplicate
         def duplicate(mtr):
-            if not mtr:
+            if mtr is None:
                 return None
 
             soft = SoftPositioner(name=mtr.name, limits=mtr.limits)
             soft.move(mtr.position)
             return soft
 
-        joint.slide, joint.lift = duplicate(joint.slide), duplicate(joint.lift)
-        return joint
+        #Build the model directly rather than copying and then replacing
+        model = type(joint)(lift   = duplicate(joint.lift),
+                            slide  = duplicate(joint.slide),
+                            offset = joint.offset)
+        model.alpha = joint.alpha
+        return model
 
 
     def __copy__(self):
@@ -271,9 +399,8 @@ class AngledJoint:
 
     def __eq__(self, other):
         if not isinstance(other, AngledJoint):
-            raise TypeError("Can not compare AngledJoint "
-                            "and {}".format(type(other)))
-        return self.slide, self.lift == other.slide, other.lift
+            return NotImplemented
+        return (self.slide, self.lift) == (other.slide, other.lift)
 
 
 class ConeJoint(AngledJoint):
@@ -281,50 +408,83 @@ class ConeJoint(AngledJoint):
     Class to represent the stand Cone joint
     """
     @property
-    def joint(self):
+    def position(self):
         """
-        Displacement of the cone joint from nominal zero as a :class:`.Point`
+        Position of the cone joint in rest coordinates as a :class:`.Point`
         """
-        return Point(self.displacement[1]*cos(self.alpha) + self.displacement[0],
-                     self.displacement[1]*sin(self.alpha),
-                     0.)
+        slide, lift  = self._readback()
+        sin_a, cos_a = self._trig()
+        return Point(lift*cos_a + slide + self._ox,
+                     lift*sin_a         + self._oy,
+                                          self._oz)
 
-    def invert(self, point, offset=True):
+
+    def _joint_tuple(self):
         """
-        Invert the matrix to find the neccesary motor positions to put the
-        joint at a specific displacement (x,y) coordinate in rest coordinates
+        Displacement of the cone joint from nominal zero as a plain tuple
+        """
+        slide, lift  = self._readback()
+        sin_a, cos_a = self._trig()
+        return (lift*cos_a + slide,
+                lift*sin_a,
+                0.)
+
+
+    def _linear_map(self):
+        """
+        Matrix of shape (3, 2) mapping (slide, lift) to the joint displacement
+        """
+        sin_a, cos_a = self._trig()
+        if self._matrix is None:
+            self._matrix = np.array([[1., cos_a],
+                                     [0., sin_a],
+                                     [0., 0.]])
+        return self._matrix
+
+
+    def _invert_xy(self, x, y, offset=True):
+        """
+        Scalar implementation of :meth:`.invert` taking the target x and y
+        as plain floats
+        """
+        #Find displacement
+        if offset:
+            x, y = x - self._ox, y - self._oy
+
+        #Share the lift between both motors, y/tan(a) == (y/sin(a))*cos(a)
+        sin_a, cos_a = self._trig()
+        lift = y/sin_a
+        return (x-lift*cos_a, lift)
+
+
+    def invert_batch(self, points, offset=True):
+        """
+        Vectorized version of :meth:`.invert` for many target points at once
 
         Parameters
-        -----------
-        point : tuple or :class:`.Point`
-            The desired x,y coordinates of the joint
+        ----------
+        points : array_like
+            Array of shape (N, 2) of desired x,y coordinates of the joint
 
         offset : bool, optional
             Subtract the offset before calculating the motor positions. If set
             to False, just the displacement of the motors should be entered
 
         Returns
-        --------
-        position : tuple
-            A tuple of the neccesary positions of the form (slide, lift)
-
-        Raises
-        ------
-        ValueError :
-            If the given position is not possible for the joint
+        -------
+        positions : ``numpy.ndarray``
+            Array of shape (N, 2) of (slide, lift) positions
         """
-        #Convert to Point object
-        if not isinstance(point, Point):
-            point = Point(*point, 0.)
+        points = np.asarray(points, dtype=float)
+        x, y   = points[:,0], points[:,1]
 
         #Find displacement
         if offset:
-            point = Point(point.x - self.offset.x,
-                          point.y - self.offset.y,
-                        0.)
+            x, y = x - self._ox, y - self._oy
 
-        return (point.x-point.y/tan(self.alpha),
-                point.y/sin(self.alpha))
+        sin_a, cos_a = self._trig()
+        lift = y/sin_a
+        return np.stack([x - lift*cos_a, lift], axis=1)
 
 
 
@@ -356,6 +516,17 @@ class Detector:
         self.slide  = slide
         self.offset = offset
 
+
+    @property
+    def offset(self):
+        """
+        The (x,y,z) distance from the cone to the zero point of the motor
+        """
+        return self._offset
+
+
+    @offset.setter
+    def offset(self, offset):
         if not isinstance(offset, Point):
             try:
                 offset = Point(*offset)
@@ -364,7 +535,9 @@ class Detector:
                                "".format(type(offset)))
                 offset = Point(0,0,0)
 
-        self.offset = offset
+        #Keep scalar copies for the hot paths
+        self._offset = offset
+        self._ox, self._oy, self._oz = offset
 
 
     @property
@@ -380,9 +553,9 @@ class Detector:
         """
         Position of the ball joint in rest coordinates as a :class:`.Point`
         """
-        return Point(self.offset.x,
-                     self.offset.y,
-                     self.displacement+self.offset.z)
+        return Point(self._ox,
+                     self._oy,
+                     self.displacement+self._oz)
 
 
     def set_displacement(self, pos, relative=False):
@@ -391,7 +564,7 @@ class Detector:
 
         Parameters
         ----------
-        displacement : float
+        pos : float
             Desired position or move of the detector
 
         relative : bool, optional
@@ -403,12 +576,11 @@ class Detector:
             Status of the requested move
         """
         if relative:
-            displacement += self.slide.position
+            pos += self.slide.position
 
-        logger.info("setting motors to {} from nominal "
-                " zero".format(displacement))
+        logger.info("setting motors to %s from nominal zero", pos)
 
-        return self.lift.move(displacement, wait=False)
+        return self.slide.move(pos, wait=False)
 
 
     @classmethod
@@ -422,11 +594,10 @@ class Detector:
         det : :class:`.Detector`
             Detector stage to model
         """
-        model = copy.copy(det)
-        model.slide = SoftPositioner(name   = det.slide.name,
-                                     limits = det.slide.limits)
-        model.slide.move(det.slide.position)
-        return model
+        slide = SoftPositioner(name   = det.slide.name,
+                               limits = det.slide.limits)
+        slide.move(det.slide.position)
+        return type(det)(slide=slide, offset=det.offset)
 
     def __copy__(self):
         det = Detector(slide  = self.slide,
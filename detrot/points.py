@@ -21,7 +21,7 @@ change.
 ############
 # Standard #
 ############
-from math        import cos, sin, tan
+from math        import cos, sin
 from collections import namedtuple
 
 ###############
@@ -64,6 +64,8 @@ class Point(namedtuple('PointBase', ['x','y','z'])):
 
         pnt == (1,2,3)
     """
+    __slots__ = ()
+
     def __repr__(self):
         return "Point (x,y,z -> {},{},{})".format(self.x,
                                                   self.y,
@@ -98,9 +100,8 @@ class StandPoint:
         The coordinates of the point in the stand reference frame as a
         :class:`.Point`
         """
-        return Point(self.offset.x + self.stand.cone.joint.x,
-                     self.offset.y + self.stand.cone.joint.y,
-                     self.offset.z)
+        #Evaluate the cone once, rather than reading its motors per axis
+        return Point._make(_stand_xyz(self.offset, self.stand.cone.joint))
 
 
     @property
@@ -109,29 +110,97 @@ class StandPoint:
         The coordinates of the point in the reference frame of the room as a
         :class:`.Point`
         """
-        #Stand Position
-        x,y,z    = self.stand_coordinates
-        ax,ay,az = self.stand.pitch, self.stand.yaw, self.stand.roll
-
-        #####
-        # X #
-        #####
-        rm_x = (x*cos(ay)*cos(az)
-             +  y*(sin(ax)*sin(ay)*cos(az)-sin(az)*cos(ax))
-             +  z*(sin(ay)*cos(ax)*cos(az)+sin(ax)*sin(az)))
-
-        #####
-        # Y #
-        #####
-        rm_y =  (x*sin(az)*cos(ay)
-              +  y*(sin(ax)*sin(ay)*sin(az)+cos(ax)*cos(az))
-              +  z*(sin(ay)*cos(ax)*sin(az)-sin(ax)*cos(az)))
-
-        #####
-        # Z #
-        #####
-        rm_z =  (-x*sin(ay)
-                + y*sin(ax)*cos(ay)
-                + z*cos(ax)*cos(ay))
-
-        return Point(rm_x, rm_y, rm_z)
+        return Point._make(self._room_xyz())
+
+
+    def _room_xyz(self):
+        """
+        The coordinates of the point in the room frame as a plain tuple
+        """
+        #A :class:`.Stand` caches its rotation until one of its angles
+        #changes, any other stand only needs to provide the angles
+        cached = getattr(self.stand, '_rotation_matrix', None)
+        if cached is not None:
+            rotation = cached()
+        else:
+            rotation = _rotation_matrix(self.stand.pitch,
+                                        self.stand.yaw,
+                                        self.stand.roll)
+
+        return _rotate(self.stand_coordinates, rotation)
+
+
+def _stand_xyz(offset, cone):
+    """
+    Stand frame coordinates of a rest frame ``offset`` for a given cone
+    joint displacement, both (x,y,z), as a plain tuple
+    """
+    return (offset[0] + cone[0],
+            offset[1] + cone[1],
+            offset[2])
+
+
+_IDENTITY = ((1., 0., 0.),
+             (0., 1., 0.),
+             (0., 0., 1.))
+
+
+def _rotation_matrix(pitch, yaw, roll):
+    """
+    Rotation matrix taking stand coordinates into the room frame as three
+    row tuples, so that it can be built once and applied to many points
+    """
+    #A stand at rest needs no trigonometry
+    if not (pitch or yaw or roll):
+        return _IDENTITY
+
+    sx, cx = sin(pitch), cos(pitch)
+    sy, cy = sin(yaw),   cos(yaw)
+    sz, cz = sin(roll),  cos(roll)
+
+    return ((cy*cz, sx*sy*cz-sz*cx, sy*cx*cz+sx*sz),
+            (sz*cy, sx*sy*sz+cx*cz, sy*cx*sz-sx*cz),
+            (-sy,   sx*cy,          cx*cy))
+
+
+def _rotation_jacobian(pitch, yaw, roll):
+    """
+    Rotation matrix along with its derivatives with respect to the pitch,
+    yaw and roll, all in the row tuple form of :func:`._rotation_matrix`
+    """
+    sx, cx = sin(pitch), cos(pitch)
+    sy, cy = sin(yaw),   cos(yaw)
+    sz, cz = sin(roll),  cos(roll)
+
+    rotation = ((cy*cz, sx*sy*cz-sz*cx, sy*cx*cz+sx*sz),
+                (sz*cy, sx*sy*sz+cx*cz, sy*cx*sz-sx*cz),
+                (-sy,   sx*cy,          cx*cy))
+
+    d_pitch  = ((0., cx*sy*cz+sz*sx, cx*sz-sx*sy*cz),
+                (0., cx*sy*sz-sx*cz, -sx*sy*sz-cx*cz),
+                (0., cx*cy,          -sx*cy))
+
+    d_yaw    = ((-sy*cz, sx*cy*cz, cx*cy*cz),
+                (-sy*sz, sx*cy*sz, cx*cy*sz),
+                (-cy,    -sx*sy,   -cx*sy))
+
+    #Roll turns the first two rows into each other
+    (xx, xy, xz), (yx, yy, yz), _ = rotation
+    d_roll   = ((-yx, -yy, -yz),
+                (xx,  xy,  xz),
+                (0.,  0.,  0.))
+
+    return rotation, (d_pitch, d_yaw, d_roll)
+
+
+def _rotate(point, matrix):
+    """
+    Apply a matrix from :func:`._rotation_matrix` to an (x,y,z) point,
+    returning a plain tuple
+    """
+    x, y, z = point
+    (xx, xy, xz), (yx, yy, yz), (zx, zy, zz) = matrix
+
+    return (xx*x + xy*y + xz*z,
+            yx*x + yy*y + yz*z,
+            zx*x + zy*y + zz*z)
@@ -22,21 +22,71 @@ moves
 ############
 # Standard #
 ############
+import time
 import logging
-from math import cos, sin, tan, fabs
+import warnings
+
 ###############
 # Third Party #
 ###############
-
+import numpy as np
+import ophyd.status
 
 ##########
 # Module #
 ##########
-from .points import StandPoint, Point
+from .points import (StandPoint, Point, _rotation_matrix, _rotate,
+                     _rotation_jacobian, _stand_xyz)
 from .joints import AngledJoint, ConeJoint, Detector
 
 logger = logging.getLogger(__name__)
 
+
+def _flatten(status):
+    """
+    Yield every status in the possibly nested collection returned by the
+    joints
+    """
+    for st in status:
+        if isinstance(st, (list, tuple)):
+            yield from _flatten(st)
+        else:
+            yield st
+
+
+def _setpoint(motor):
+    """
+    Position a motor was last asked to move to, or None if that is unknown
+    """
+    #EPICS motors report their requested position directly
+    setpoint = getattr(motor, 'user_setpoint', None)
+    if setpoint is not None:
+        return setpoint.get()
+
+    #Otherwise the readback is only the target once the motor has stopped
+    if getattr(motor, 'moving', True):
+        return None
+
+    return motor.position
+
+
+def _angle(name, doc):
+    """
+    Create a property for a stand angle that drops the cached rotation
+    whenever the angle is changed
+    """
+    attr = '_' + name
+
+    def fget(self):
+        return getattr(self, attr)
+
+    def fset(self, value):
+        setattr(self, attr, value)
+        self._rotation = None
+
+    return property(fget, fset, doc=doc)
+
+
 class Stand:
     """
     Represent a detector stand
@@ -79,6 +129,13 @@ class Stand:
     """
     joint_names = ('cone', 'vee', 'flat')
 
+    pitch = _angle('pitch', "The rotation about the X axis in radians")
+    yaw   = _angle('yaw',   "The rotation about the Y axis in radians")
+    roll  = _angle('roll',  "The rotation about the Z axis in radians")
+
+    #Default tolerance (mm) below which a joint move is not ordered
+    _move_eps = 1e-4
+
     def __init__(self, cone=None, flat=None, vee=None, det=None):
 
         #Angles
@@ -93,7 +150,8 @@ class Stand:
         self.detector = det
 
 
-    def find_angles(self, precision= 0.001, min_iterations=30):
+    def find_angles(self, precision=0.001, min_iterations=None, *,
+                    max_iterations=60):
         """
         Return the value of the pitch, yaw, and roll through an iterative
         process of comparing estimated angles and motor encoder readbacks.
@@ -105,15 +163,20 @@ class Stand:
         can use the geometry of each joint to see where our estimation would
         put the position of the motors. By comparing  these motor positions
         with the actual encoder values on the stand, we can get a sense of how
-        far our predicted angles are from reality. By iterating through this
-        process a number of times, the true angle of the stand can be
-        determined.
+        far our predicted angles are from reality.
+
+        Each iteration is a Newton step. The joint inversions are linear, so
+        the sensitivity of the three motor errors to each angle follows
+        directly from the derivatives of the rotation matrix, and the
+        resulting 3x3 system is solved for the correction to the angles. This
+        converges within a handful of iterations, where a fixed-step update
+        needed several dozen.
 
         The algorithm looks for one of two conditions to end the iterative
-        process, first if the desired precision for our estimate is reached, as
-        well as the minimum number of iterations we can stop searching for a
-        solution. Secondly, if the number of iterations has gone past twice the
-        minimum value, we stop searching for a solution.
+        process, first if the desired precision for our estimate is reached we
+        can stop searching for a solution. Secondly, if ``max_iterations``
+        steps have been taken without reaching it, we stop searching for a
+        solution.
 
         Parameters
         ----------
@@ -121,64 +184,149 @@ class Stand:
             The precision required for the estimated motor positions.
 
         min_iterations : int, optional
-            The minimum number of iterations before the function will exit.
+            Deprecated, Newton steps need no minimum. For compatibility the
+            search is abandoned after twice this many iterations, use
+            ``max_iterations`` instead
+
+        max_iterations : int, optional
+            The number of iterations allowed before the search is abandoned
 
         Returns
         -------
         angles : tuple
             Pitch, Yaw and Roll of the detector chamber
         """
+        if min_iterations is not None:
+            warnings.warn("min_iterations is deprecated, use max_iterations",
+                          DeprecationWarning, stacklevel=2)
+            max_iterations = 2*min_iterations
+
         it = 0
         logger.debug("Finding angles of stand ...")
 
-        flat = StandPoint(self.flat.offset, self)
-        vee  = StandPoint(self.vee.offset,  self)
+        #Motors do not move while searching, read each of them only once
+        fl_d         = self.flat.displacement
+        (vs_d, vl_d) = self.vee.displacement
+
+        #Stand frame positions are fixed as well, only the angles change
+        cone = self.cone._joint_tuple()
+        flat = _stand_xyz(self.flat.offset, cone)
+        vee  = _stand_xyz(self.vee.offset,  cone)
+
+        #Bind everything the loop touches to locals
+        fl_invert, vee_invert = self.flat._invert_xy, self.vee._invert_xy
+        jac = np.empty((3,3))
+
+        pitch, yaw, roll = self.pitch, self.yaw, self.roll
+
         #Begin iteration
         while True:
 
-            #Find error in predicted flat motor position from current angles
-            fl_e =  (self.flat.invert(flat.room_coordinates)
-                     - self.flat.displacement)
-            logger.debug("Found an error of {} mm in the prediction "
-                         "of the flat slide motor"
-                         "".format(fl_e))
-
-            #Find error in predicted vee motor position from current angles
-            predictions  = self.vee.invert(vee.room_coordinates)
-            (vs_e, vl_e) = [pred - actual for (actual,pred) in
-                            zip(self.vee.displacement, predictions)]
-            logger.debug("Found a lift error of {} mm and a slide error of "
-                         "{} mm for the motors in the vee joint"
-                         "".format(vl_e, vs_e))
-
-            #End iteration if loop and precision thresholds have been met
-            if (it > min_iterations and precision > max([fabs(fl_e),
-                                                         fabs(vl_e),
-                                                         fabs(vs_e)])):
+            rot, derivatives = _rotation_jacobian(pitch, yaw, roll)
+
+            #Find error in predicted motor positions from current angles,
+            #rotating both joints with a single matrix
+            fl_x, fl_y, _   = _rotate(flat, rot)
+            vee_x, vee_y, _ = _rotate(vee,  rot)
+            (vs_p, vl_p)    = vee_invert(vee_x, vee_y)
+
+            fl_e = fl_invert(fl_x, fl_y) - fl_d
+            vs_e = vs_p - vs_d
+            vl_e = vl_p - vl_d
+            logger.debug("Found an error of %s mm in the prediction "
+                         "of the flat slide motor", fl_e)
+            logger.debug("Found a lift error of %s mm and a slide error of "
+                         "%s mm for the motors in the vee joint", vl_e, vs_e)
+
+            #End iteration if precision threshold has been met
+            if precision > max(abs(fl_e), abs(vs_e), abs(vl_e)):
                 logger.info("Succesfully found stand angles")
                 break
 
-            #End iteration if loop has gone twice the minima
-            if it > 2*min_iterations:
+            #End iteration if loop has used up its iterations
+            if it >= max_iterations:
                 logger.warning("Unable to converge on angles for the stand")
                 break
 
             #Adjust the angle predictions 
-            logger.debug("Iteration {} ...".format(it))
-
-            self.pitch += (vl_e + vs_e)/(3*self.vee.offset.z)
-            self.yaw   +=  vs_e/(-3*self.vee.offset.z)
-            self.roll  += (fl_e - vl_e)/(3*(sin(self.vee.alpha)
-                                         +self.vee.offset.x
-                                         -self.flat.offset.x))
-
-            logger.debug("Pitch, Yaw, and Roll adjusted to {}"
-                         "".format((self.pitch, self.yaw, self.roll)))
+            logger.debug("Iteration %s ...", it)
+
+            #Jacobian of the motor errors with respect to the angles, the
+            #inversions are linear so each column is the inverted change in
+            #joint position without the offsets
+            for i, d_rot in enumerate(derivatives):
+                dfl_x, dfl_y, _ = _rotate(flat, d_rot)
+                dvee_x, dvee_y, _ = _rotate(vee, d_rot)
+                jac[0, i]  = fl_invert(dfl_x, dfl_y, offset=False)
+                jac[1:, i] = vee_invert(dvee_x, dvee_y, offset=False)
+
+            #Least squares rather than a plain solve, degenerate geometries
+            #(e.g coincident joints) leave an angle unconstrained
+            dpitch, dyaw, droll = np.linalg.lstsq(jac, (fl_e, vs_e, vl_e),
+                                                  rcond=None)[0]
+            pitch -= float(dpitch)
+            yaw   -= float(dyaw)
+            roll  -= float(droll)
+
+            logger.debug("Pitch, Yaw, and Roll adjusted to %s",
+                         (pitch, yaw, roll))
 
             it += 1
+
+        self.pitch, self.yaw, self.roll = pitch, yaw, roll
         return (self.pitch, self.yaw, self.roll)
 
 
+    def _rotation_matrix(self):
+        """
+        Rotation from the stand frame into the room frame for the current
+        angles, only rebuilt after one of the angles changes
+        """
+        if self._rotation is None:
+            self._rotation = _rotation_matrix(self.pitch, self.yaw, self.roll)
+        return self._rotation
+
+
+    def transform_points(self, coords):
+        """
+        Transform many points from the stand frame into the room frame with
+        a single matrix product
+
+        Parameters
+        ----------
+        coords : array_like
+            Array of shape (N, 3) of coordinates in the stand frame, as given
+            by :attr:`.StandPoint.stand_coordinates`
+
+        Returns
+        -------
+        coords : ``numpy.ndarray``
+            Array of shape (N, 3) of coordinates in the room frame
+        """
+        return np.asarray(coords, dtype=float) @ np.array(self._rotation_matrix()).T
+
+
+    def positions(self):
+        """
+        Rest frame positions of every joint, evaluated in one vectorized step
+
+        The linear maps of the joints are stacked into a single array and
+        contracted with the motor readbacks at once, rather than asking each
+        joint for its :attr:`.position` in turn
+
+        Returns
+        -------
+        positions : ``numpy.ndarray``
+            Array of shape (3, 3) with one row per joint, ordered as
+            :attr:`.joint_names`
+        """
+        joints  = [getattr(self, name) for name in self.joint_names]
+        maps    = np.array([j._linear_map() for j in joints])
+        motors  = np.array([j._readback()   for j in joints])
+        offsets = np.array([j.offset        for j in joints])
+        return np.einsum('ijk,ik->ij', maps, motors) + offsets
+
+
     def translate(self, dx=0., dy=0., wait=False, timeout=5.0):
         """"
         Translate the entire stand in x,y
@@ -218,19 +366,19 @@ class Stand:
         RuntimeError
             If the status failed to complete successfully 
         """
-        ax, ay, az = self.pitch, self.yaw, self.roll
-
-        logger.debug("Translating stand {} mm horizontally, and {} "
-                     "vertically".format(dx,dy))
-
-        #Calculate displacement in room coordinates
-        mx = dx*cos(ay)*cos(az) + dy*sin(az)*cos(ay)
-        my = (dx*(sin(ax)*sin(ay)*cos(az) - sin(az)*cos(ax))
-            + dy*(sin(ax)*sin(ay)*sin(az) + cos(ax)*cos(az)))
-
-        return self.set_displacement(cone = self.cone.invert((mx,my), offset=False),
-                                     flat = self.flat.invert((mx,my), offset=False),
-                                     vee  = self.vee.invert((mx,my),  offset=False),
+        logger.debug("Translating stand %s mm horizontally, and %s "
+                     "vertically", dx, dy)
+
+        #Calculate displacement in rest coordinates, the inverse rotation is
+        #the transpose of the cached stand rotation
+        (xx, xy, _), (yx, yy, _), _ = self._rotation_matrix()
+        mx = dx*xx + dy*yx
+        my = dx*xy + dy*yy
+
+        #All joints move by the same amount, skip the Point handling of invert
+        return self.set_displacement(cone = self.cone._invert_xy(mx, my, offset=False),
+                                     flat = self.flat._invert_xy(mx, my, offset=False),
+                                     vee  = self.vee._invert_xy(mx, my,  offset=False),
                                      relative=True, wait=wait, timeout=timeout)
 
 
@@ -238,12 +386,12 @@ class Stand:
         """
         Rotate the detector stand, while keeping the cone joint stationary
 
-        This is calculated by using the :meth:`.model` of the stand and
-        manually adjusting the angles to meet the requested move. From there we
-        can find the position of each joint by using the
-        :attr:`.room_coordinates` of each of the joint balls. Once we have
-        these the ``invert`` method of each joint gives us the requested motor
-        positions that correspond to the change in rotation
+        This is calculated by building the rotation for the requested angles
+        and applying it to the :attr:`.stand_coordinates` of each of the joint
+        balls. Only the angles differ from the current stand, so no full
+        :meth:`.model` is required. Once we have these room coordinates the
+        ``invert`` method of each joint gives us the requested motor positions
+        that correspond to the change in rotation
 
         Parameters
         ----------
@@ -277,19 +425,21 @@ class Stand:
         RuntimeError
             If the status failed to complete successfully 
         """
-        #Setup model with requested angles
-        model = Stand.model(self)
-        model.pitch += dpitch
-        model.yaw   += dyaw
-        model.roll  += droll
-
-        #See where joint positions lie in the new model
-        model_vee  = StandPoint(self.vee.offset,  model)
-        model_flat = StandPoint(self.flat.offset, model)
-
-        #Make motor agree with model
-        return self.set_displacement(flat = self.flat.invert(model_flat.room_coordinates),
-                                     vee  = self.vee.invert(model_vee.room_coordinates),
+        #Rotation with the requested angles, the cone and therefore the stand
+        #coordinates of each joint are unchanged by the move
+        rot = _rotation_matrix(self.pitch + dpitch,
+                               self.yaw   + dyaw,
+                               self.roll  + droll)
+
+        #See where joint positions lie after the rotation, reading the cone
+        #motors once for both joints
+        cone = self.cone._joint_tuple()
+        vee_x, vee_y, _ = _rotate(_stand_xyz(self.vee.offset,  cone), rot)
+        fl_x,  fl_y,  _ = _rotate(_stand_xyz(self.flat.offset, cone), rot)
+
+        #Make motor agree with rotation
+        return self.set_displacement(flat = self.flat._invert_xy(fl_x, fl_y),
+                                     vee  = self.vee._invert_xy(vee_x, vee_y),
                                      wait=wait, timeout=timeout)
 
 
@@ -353,8 +503,8 @@ class Stand:
         RuntimeError
             If the status failed to complete successfully 
         """
-        logger.debug("Rotating point {} on the detector axis about point {}"
-                     "".format(z, origin))
+        logger.debug("Rotating point %s on the detector axis about point %s",
+                     z, origin)
         #Setup model
         model       = Stand.model(self)
         model_fixed = StandPoint((model.detector.position.x,
@@ -363,15 +513,14 @@ class Stand:
                                   model)
 
         #Save initial position for reference
-        initial = model_fixed.room_coordinates
+        (ix, iy, iz) = model_fixed._room_xyz()
 
         #Small angle approximate
         dpitch = dy/(origin - z)
         dyaw   = dx/(z - origin)
 
         logger.debug("Small angle approximation requests a change in pitch "
-                     "and yaw of {}, {} respectively"
-                     "".format(dpitch, dyaw))
+                     "and yaw of %s, %s respectively", dpitch, dyaw)
 
         #Rotate model to move desired point
         model.rotate(dpitch=dpitch, dyaw=dyaw)
@@ -381,10 +530,10 @@ class Stand:
         its = 0
         while its < retries:
             #Find change from initial origin
-            dx, dy, dz = [m -r for (m,r) in zip(model_fixed.room_coordinates,
-                                                initial)]
-            logger.info("Fixed point has error x,y,z -> ({},{},{})"
-                        "".format(dx,dy,dz))
+            (mx, my, mz) = model_fixed._room_xyz()
+            dx, dy, dz   = mx - ix, my - iy, mz - iz
+            logger.info("Fixed point has error x,y,z -> (%s,%s,%s)",
+                        dx, dy, dz)
 
             #Approximate neccesary translation
             xslope = dz * (model.pitch*model.roll + model.yaw)
@@ -424,7 +573,7 @@ class Stand:
         return model
 
 
-    def from_model(self, model, wait=False, timeout=5):
+    def from_model(self, model, wait=False, timeout=5, tolerance=None):
         """
         Move the detector stand to be in aggreance with a model
 
@@ -433,6 +582,10 @@ class Stand:
         model : class:`.Stand`
             The model to copy
 
+        tolerance : float, optional
+            Joints already within this many mm of the model are not moved,
+            see :meth:`.set_displacement`
+
         wait : bool
             Block thread until move finishes
 
@@ -457,9 +610,37 @@ class Stand:
         return self.set_displacement(cone = model.cone.displacement,
                                      flat = model.flat.displacement,
                                      vee  = model.vee.displacement,
-                                     wait=wait, timeout=timeout)
+                                     wait=wait, timeout=timeout,
+                                     tolerance=tolerance)
+
+    def _within_eps(self, joint, displacement, relative, tolerance):
+        """
+        Whether a requested displacement moves every motor of the joint by
+        less than ``tolerance`` mm
+
+        Absolute requests are compared with where each motor was last asked
+        to go rather than its readback, so that a motor still travelling is
+        not mistaken for one that has arrived. If that is unknown for any
+        motor the move is never skipped
+        """
+        delta = np.atleast_1d(np.asarray(displacement, dtype=float))
+        if not relative:
+            if joint.slide is None:
+                motors = (joint.lift,)
+            else:
+                motors = (joint.slide, joint.lift)
+
+            setpoints = [_setpoint(motor) for motor in motors]
+            if None in setpoints:
+                return False
+
+            delta = delta - setpoints
+
+        return bool(np.all(np.abs(delta) < tolerance))
+
 
-    def set_displacement(self,  wait=False, timeout=5.0, relative=False,  **kwargs):
+    def set_displacement(self,  wait=False, timeout=5.0, relative=False,
+                         tolerance=None, **kwargs):
         """
         Set the displacement of the joints
 
@@ -477,6 +658,10 @@ class Stand:
         relative : bool, optional
             Choice of relative or absolute move
 
+        tolerance : float, optional
+            Joints whose motors would all move by less than this many mm are
+            left alone. Defaults to 1e-4 mm, 0 orders every requested move
+
         wait : bool
             Block thread until move finishes
 
@@ -488,7 +673,8 @@ class Stand:
         Returns
         -------
         statuses : list of status
-            List of MoveStatus
+            List of MoveStatus, joints asked to move less than
+            ``tolerance`` are not moved and have no status
 
         Raises
         ------
@@ -500,9 +686,19 @@ class Stand:
         """
         status = []
 
+        if tolerance is None:
+            tolerance = self._move_eps
+
         #Find requested joints
         for joint in self.joint_names:
             if joint in kwargs:
+                #Skip joints that are already where they were asked to be
+                if self._within_eps(getattr(self, joint), kwargs[joint],
+                                    relative, tolerance):
+                    logger.debug("Skipping move of %s joint below %s mm",
+                                 joint, tolerance)
+                    continue
+
                 #Order move
                 st = getattr(self, joint).set_displacement(kwargs[joint],
                                                            relative=relative)
@@ -510,18 +706,21 @@ class Stand:
                 status.append(st)
 
         #Perform motion
-        if wait:
-            #Wait for each movement to finish
+        if wait and status:
+            #Motors move in parallel, the timeout bounds the whole move
+            deadline = None if timeout is None else time.monotonic() + timeout
             try:
-                print("Waiting for motion to be completed ...") 
-                [ophyd.status.wait(s, timeout=timeout) for s in status]
+                logger.info("Waiting for motion to be completed ...")
+                for st in _flatten(status):
+                    if deadline is not None:
+                        timeout = max(deadline - time.monotonic(), 0.)
+                    ophyd.status.wait(st, timeout=timeout)
 
             #Stop all motion if one motor fails
             except:
-                print("Exception raised, stopping motors ...")
-                self.cone.stop()
-                self.flat.stop()
-                self.vee.stop()
+                logger.warning("Exception raised, stopping motors ...")
+                for joint in self.joint_names:
+                    getattr(self, joint).stop()
                 raise
 
         return status
@@ -8,9 +8,13 @@ setup(name= 'detrot',
       author='SLAC National Accelerator Laboratory',
 
       packages=find_packages(),
+      python_requires='>=3.5',
+      install_requires=['numpy>=1.14'],
       description='Python framework for manipulating the CXI detector stands',
       classifiers=[
-          'Programming Language :: Python :: 3.4',
+          'Programming Language :: Python :: 3',
+          'Programming Language :: Python :: 3.5',
+          'Programming Language :: Python :: 3.6',
           'Topic :: Robotics, EPICS'
       ],
     )
@@ -20,6 +20,9 @@ class PseudoMotor:
 
     stop_call = Mock()
 
+    #Moves complete instantly
+    moving = False
+
     def __init__(self, position):
         self.position = position
         self.name = 'pseudo'
@@ -12,7 +12,7 @@ import pytest
 ##########
 # Module #
 ##########
-from detrot  import ConeJoint, AngledJoint, StandPoint, Point
+from detrot  import ConeJoint, AngledJoint, Detector, StandPoint, Point
 from conftest import PseudoMotor
 
 @pytest.fixture(scope='function')
@@ -46,6 +46,14 @@ def test_cone_invert(pseudo_cone):
     assert pseudo_cone.invert((13.07,9.07))[0] == pytest.approx(5,0.1)
     assert pseudo_cone.invert((13.07,9.07))[1] == pytest.approx(10,0.1)
 
+def test_cone_invert_batch(pseudo_cone):
+    pseudo_cone.alpha = math.pi/4.
+    pts    = [(13.07,9.07), (6., 2.), (1., 2.)]
+    result = pseudo_cone.invert_batch(pts)
+    assert result.shape == (3,2)
+    for pt, res in zip(pts, result):
+        assert tuple(res) == pytest.approx(pseudo_cone.invert(pt))
+
 def test_angle_joint(pseudo_angle):
     #Test Vertical
     pseudo_angle.alpha = math.pi/2.
@@ -75,6 +83,20 @@ def test_angle_invert(pseudo_angle):
     pseudo_angle.slide = None
     assert pseudo_angle.invert((6,12)) == pytest.approx(10,0.1)
 
+def test_angle_invert_batch(pseudo_angle):
+    pts    = [(6,12), (1,2), (-3,4)]
+    result = pseudo_angle.invert_batch(pts, offset=False)
+    assert result.shape == (3,2)
+    for pt, res in zip(pts, result):
+        assert tuple(res) == pytest.approx(pseudo_angle.invert(pt, offset=False))
+
+    #Test no-slide
+    pseudo_angle.slide = None
+    result = pseudo_angle.invert_batch(pts)
+    assert result.shape == (3,)
+    assert list(result) == pytest.approx([pseudo_angle.invert(pt)
+                                          for pt in pts])
+
 def test_position(pseudo_cone):
     pseudo_cone.alpha= 0
     assert pseudo_cone.position == (16, 2, 3)
@@ -84,6 +106,23 @@ def test_position(pseudo_cone):
     assert pseudo_cone.position.y == 12
     assert pseudo_cone.position.z == 3
 
+def test_position_batch(pseudo_angle, pseudo_cone):
+    moves = [(5,10), (-2,3), (0,0)]
+    for joint in (pseudo_angle, pseudo_cone):
+        result = joint.position_batch(moves)
+        assert result.shape == (3,3)
+        for (slide, lift), res in zip(moves, result):
+            joint.slide.move(slide)
+            joint.lift.move(lift)
+            assert tuple(res) == pytest.approx(joint.position)
+
+    #Test no-slide
+    pseudo_angle.slide = None
+    result = pseudo_angle.position_batch([10, 3])
+    assert result.shape == (2,3)
+    pseudo_angle.lift.move(3)
+    assert tuple(result[1]) == pytest.approx(pseudo_angle.position)
+
 def test_displacement(pseudo_angle):
     assert pseudo_angle.displacement == (5,10)
     pseudo_angle.slide = None
@@ -130,5 +169,47 @@ def test_cmp():
     p1 = PseudoMotor(5)
     p2 = PseudoMotor(10)
     assert AngledJoint(p1,p2) == AngledJoint(p1, p2)
-
-
+    assert AngledJoint(p1,p2) != AngledJoint(p2, p1)
+    assert AngledJoint(p1,p2) != AngledJoint(p1, None)
+    assert AngledJoint(p1,p2) != (p1, p2)
+
+
+
+def test_alpha_default():
+    assert AngledJoint.alpha == math.pi/12.
+
+    class SteepJoint(AngledJoint):
+        alpha = math.pi/2.
+
+    assert SteepJoint.alpha == math.pi/2.
+    joint = SteepJoint(lift=PseudoMotor(10), offset=Point(0,0,0))
+    assert joint.alpha == math.pi/2.
+    assert joint.position.y == pytest.approx(10)
+    assert joint.position.z == pytest.approx(0)
+    #Instances may still override the class default
+    joint.alpha = 0.
+    assert joint.position.y == pytest.approx(0)
+    assert joint.position.z == pytest.approx(10)
+    assert SteepJoint.alpha == math.pi/2.
+
+def test_alpha_class_assignment():
+    joint = AngledJoint(lift=PseudoMotor(10), offset=Point(0,0,0))
+    assert joint.position.y == pytest.approx(10*math.sin(math.pi/12.))
+    #Changing the class default after creation reaches existing joints
+    AngledJoint.alpha = math.pi/2.
+    try:
+        assert joint.alpha == math.pi/2.
+        assert joint.position.y == pytest.approx(10)
+        assert joint.position.z == pytest.approx(0)
+        assert joint.invert((0,10)) == pytest.approx(10)
+    finally:
+        AngledJoint.alpha = math.pi/12.
+    assert joint.position.y == pytest.approx(10*math.sin(math.pi/12.))
+
+def test_detector_set_displacement():
+    det = Detector(slide=PseudoMotor(5), offset=Point(0,1,2))
+    det.set_displacement(10)
+    assert det.displacement == 10
+    assert det.position == (0,1,12)
+    det.set_displacement(-3, relative=True)
+    assert det.displacement == 7
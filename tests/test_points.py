@@ -3,6 +3,7 @@
 ############
 import math
 import logging
+from types import SimpleNamespace
 
 ###############
 # Third Party #
@@ -12,7 +13,8 @@ import pytest
 ##########
 # Module #
 ##########
-from detrot  import Point, StandPoint
+from detrot        import Point, StandPoint
+from detrot.points import _rotation_matrix, _rotate, _IDENTITY
 
 
 @pytest.fixture(scope='function')
@@ -66,3 +68,49 @@ def test_room_coordinates(coord_stand):
     assert coord_stand.room_coordinates.y == 5
     assert coord_stand.room_coordinates.z == 3
 
+
+
+def test_transform_points(coord_stand):
+    stand = coord_stand.stand
+    stand.pitch, stand.yaw, stand.roll = 0.1, -0.2, 0.3
+    points = [StandPoint(offset, stand)
+              for offset in [(1,2,3), (-4,0,2), (0,0,0)]]
+
+    result = stand.transform_points([p.stand_coordinates for p in points])
+    assert result.shape == (3,3)
+    for point, row in zip(points, result):
+        assert tuple(row) == pytest.approx(point.room_coordinates)
+
+def test_duck_typed_stand(coord_stand):
+    #Only the public angles and cone joint are required of a stand
+    coord_stand.stand.pitch = math.pi/90
+    coord_stand.stand.yaw   = math.pi/60
+    coord_stand.stand.roll  = -math.pi/45
+    stand = SimpleNamespace(cone  = SimpleNamespace(joint=coord_stand.stand.cone.joint),
+                            pitch = coord_stand.stand.pitch,
+                            yaw   = coord_stand.stand.yaw,
+                            roll  = coord_stand.stand.roll)
+    duck  = StandPoint(coord_stand.offset, stand)
+    assert duck.stand_coordinates == coord_stand.stand_coordinates
+    assert duck.room_coordinates  == pytest.approx(coord_stand.room_coordinates)
+
+def test_rotation_at_rest():
+    assert _rotation_matrix(0, 0, 0) is _IDENTITY
+    assert _rotation_matrix(0., -0., 0.) is _IDENTITY
+    #Any non-zero angle builds a real rotation
+    assert _rotation_matrix(0, 0, 1e-9) is not _IDENTITY
+
+def test_rotation_cache_reset(coord_stand):
+    stand = coord_stand.stand
+    rest  = coord_stand.room_coordinates
+    #Each angle on its own must drop the cached rotation
+    for angle in ('pitch', 'yaw', 'roll'):
+        setattr(stand, angle, math.pi/36)
+        moved = coord_stand.room_coordinates
+        assert moved != pytest.approx(rest)
+        assert moved == pytest.approx(_rotate(coord_stand.stand_coordinates,
+                                              _rotation_matrix(stand.pitch,
+                                                               stand.yaw,
+                                                               stand.roll)))
+        setattr(stand, angle, 0.)
+        assert coord_stand.room_coordinates == rest
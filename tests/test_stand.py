@@ -2,16 +2,22 @@
 # Standard #
 ############
 import math
+import logging
+import time
+import threading
+from unittest.mock import Mock
 
 ###############
 # Third Party #
 ###############
+import ophyd.status
 import pytest
 
 ##########
 # Module #
 ##########
-from detrot import ConeJoint, AngledJoint, StandPoint, Point
+from detrot import ConeJoint, AngledJoint, StandPoint, Point, Stand
+from conftest import PseudoMotor
 
 def test_find_angle(pseudo_stand):
     pseudo_stand.find_angles()
@@ -48,6 +54,15 @@ def test_find_angle(pseudo_stand):
     assert pseudo_stand.yaw   == pytest.approx(-math.pi/15, abs=3*math.pi/180)
     assert pseudo_stand.roll  == pytest.approx(0, abs=math.pi/180)
 
+def test_positions(pseudo_stand):
+    pseudo_stand.translate(dx=1,dy=2)
+    pseudo_stand.vee.slide.move(3.)
+    positions = pseudo_stand.positions()
+    assert positions.shape == (3,3)
+    for name, pos in zip(pseudo_stand.joint_names, positions):
+        joint = getattr(pseudo_stand, name)
+        assert tuple(pos) == pytest.approx(joint.position)
+
 def test_translate(pseudo_stand):
     pseudo_stand.translate(dx=1,dy=2)
     assert pseudo_stand.cone.position.x  == pytest.approx(2, abs=0.0001)
@@ -91,6 +106,28 @@ def test_rotate(pseudo_stand):
     assert pseudo_stand.yaw   == pytest.approx(0., abs=math.pi/180)
     assert pseudo_stand.roll  == pytest.approx(0., abs=math.pi/180)
 
+def test_rotate_matches_model(pseudo_stand):
+    pseudo_stand.cone.offset = Point(0., 0., 0.)
+    pseudo_stand.flat.offset = Point(-10.,  0.,  -20.)
+    pseudo_stand.vee.offset  = Point(10., 0.,  -20.)
+    pseudo_stand.cone.set_displacement((1., 2.))
+    pseudo_stand.pitch, pseudo_stand.yaw, pseudo_stand.roll = 0.01, -0.02, 0.03
+    (dpitch, dyaw, droll) = (math.pi/90, -math.pi/60, math.pi/45)
+
+    #Motor targets as found by rotating a full model of the stand
+    model = Stand.model(pseudo_stand)
+    model.pitch += dpitch
+    model.yaw   += dyaw
+    model.roll  += droll
+    flat = pseudo_stand.flat.invert(StandPoint(pseudo_stand.flat.offset,
+                                               model).room_coordinates)
+    vee  = pseudo_stand.vee.invert(StandPoint(pseudo_stand.vee.offset,
+                                              model).room_coordinates)
+
+    pseudo_stand.rotate(dpitch=dpitch, dyaw=dyaw, droll=droll)
+    assert pseudo_stand.flat.displacement == pytest.approx(flat)
+    assert pseudo_stand.vee.displacement  == pytest.approx(vee)
+
 def test_align(pseudo_stand):
     #Create offsets
     pseudo_stand.cone.offset = Point(0., 0., 0.)
@@ -117,3 +154,91 @@ def test_align(pseudo_stand):
     assert fixed.room_coordinates.y == pytest.approx(origin.y, abs=0.1)
     assert mobile.room_coordinates.x == pytest.approx(start.x-2., abs=0.1)
     assert mobile.room_coordinates.y == pytest.approx(start.y+9., abs=0.1)
+
+def test_set_displacement_skips_tiny_moves(pseudo_stand):
+    pseudo_stand.vee.slide.move(3.)
+    #Absolute request matching the current setpoint
+    status = pseudo_stand.set_displacement(vee=(3., 0.), flat=1.)
+    assert len(status) == 1
+    assert pseudo_stand.flat.displacement == 1.
+    #Relative request below motor resolution
+    status = pseudo_stand.set_displacement(cone=(1e-6, 0.), relative=True)
+    assert status == []
+    assert pseudo_stand.cone.displacement == (0., 0.)
+    #Unless the tolerance is lowered
+    status = pseudo_stand.set_displacement(cone=(1e-6, 0.), relative=True,
+                                           tolerance=0.)
+    assert len(status) == 1
+    assert pseudo_stand.cone.displacement == (1e-6, 0.)
+
+def test_set_displacement_setpoint(pseudo_stand):
+    lift = pseudo_stand.flat.lift
+    #A motor still travelling has not reached its readback position
+    lift.moving = True
+    assert len(pseudo_stand.set_displacement(flat=0.)) == 1
+    #EPICS motors are compared with their requested position
+    lift.user_setpoint = Mock(**{'get.return_value': 2.})
+    assert pseudo_stand.set_displacement(flat=2.) == []
+    assert len(pseudo_stand.set_displacement(flat=0.)) == 1
+
+def test_set_displacement_wait(pseudo_stand):
+    model = Stand.model(pseudo_stand)
+    model.translate(dx=1, dy=2, wait=True)
+    assert model.cone.position.x == pytest.approx(2, abs=0.0001)
+    assert model.cone.position.y == pytest.approx(4, abs=0.0001)
+
+def test_set_displacement_timeout(pseudo_stand):
+    #Motors that each arrive 0.15 s after the previous one
+    timers = []
+
+    def move(pos, wait=False):
+        status = ophyd.status.StatusBase()
+        timers.append(threading.Timer(0.15*(len(timers)+1),
+                                      status.set_finished))
+        timers[-1].start()
+        return status
+
+    for name in pseudo_stand.joint_names:
+        joint = getattr(pseudo_stand, name)
+        for motor in (joint.slide, joint.lift):
+            if motor is not None:
+                motor.move = move
+
+    calls = PseudoMotor.stop_call.method.call_count
+    start = time.monotonic()
+    try:
+        #No single motor takes longer than the timeout after the last one
+        with pytest.raises(ophyd.status.WaitTimeoutError):
+            pseudo_stand.translate(dx=1, dy=1, wait=True, timeout=0.2)
+        #One timeout for the whole move, not one per motor
+        assert time.monotonic() - start == pytest.approx(0.2, abs=0.1)
+        assert PseudoMotor.stop_call.method.call_count > calls
+    finally:
+        for timer in timers:
+            timer.cancel()
+
+def test_find_angles_iterations(pseudo_stand, caplog):
+    pseudo_stand.cone.offset = Point(0., 0., 0.)
+    pseudo_stand.flat.offset = Point(-10.,  0.,  -20.)
+    pseudo_stand.vee.offset  = Point(10., 0.,  -20.)
+    pseudo_stand.rotate(dpitch=math.pi/36, dyaw=-math.pi/30, droll=math.pi/24)
+    pseudo_stand.pitch, pseudo_stand.yaw, pseudo_stand.roll = 0., 0., 0.
+
+    caplog.set_level(logging.DEBUG, logger='detrot.stand')
+    angles = pseudo_stand.find_angles(precision=1e-6)
+    #Newton steps from rest converge in a fixed handful of iterations
+    steps = [r for r in caplog.records if r.msg.startswith('Iteration')]
+    assert len(steps) == 3
+    assert angles == pytest.approx((math.pi/36, -math.pi/30, math.pi/24),
+                                   abs=1e-7)
+
+    #Running out of iterations leaves the best estimate so far
+    caplog.clear()
+    pseudo_stand.pitch, pseudo_stand.yaw, pseudo_stand.roll = 0., 0., 0.
+    pseudo_stand.find_angles(precision=1e-6, max_iterations=1)
+    assert 'Unable to converge' in caplog.text
+    assert pseudo_stand.pitch != 0.
+
+def test_find_angles_min_iterations(pseudo_stand):
+    with pytest.warns(DeprecationWarning):
+        pseudo_stand.find_angles(min_iterations=10)